@@ -68,7 +68,7 @@ def update_rsl_rl_cfg(agent_cfg: RslRlOnPolicyRunnerCfg, args_cli: argparse.Name
         The updated configuration for RSL-RL agent based on inputs.
     """
     # override the default configuration with CLI arguments
-    if hasattr(args_cli, "seed") and args_cli.seed is not None:
+    if getattr(args_cli, "seed", None) is not None:
         # randomly sample a seed if seed = -1
         if args_cli.seed == -1:
             args_cli.seed = random.randint(0, 10000)
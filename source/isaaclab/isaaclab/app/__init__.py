@@ -12,5 +12,5 @@ These include:
 
 """
 
-from .app_launcher import AppLauncher  # noqa: F401, F403
+from .app_launcher import AppLauncher, get_app  # noqa: F401, F403
 from .runners import run_tests  # noqa: F401, F403
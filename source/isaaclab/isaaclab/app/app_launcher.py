@@ -13,6 +13,7 @@ fault occurs. The launched :class:`isaacsim.simulation_app.SimulationApp` instan
 """
 
 import argparse
+import atexit
 import contextlib
 import os
 import re
@@ -717,3 +718,33 @@ class AppLauncher:
         """Handle the abort/segmentation/kill signals."""
         # close the app
         self._app.close()
+
+
+_APP_LAUNCHER: AppLauncher | None = None
+"""The launcher behind the process-wide simulation app returned by :func:`get_app`."""
+
+
+def get_app(**kwargs) -> SimulationApp:
+    """Returns a process-wide simulation app, launching it on the first call.
+
+    Only one simulation app can exist per process. Modules that may end up sharing a process, such
+    as test files collected into a single pytest session, should acquire the app through this
+    function instead of constructing an :class:`AppLauncher` at import time, so that the multi-second
+    Kit startup cost is paid once per process instead of once per module.
+
+    The keyword arguments are forwarded to :class:`AppLauncher` and only take effect on the first
+    call. Later calls return the already-running app unchanged, since the loaded feature set cannot
+    be changed after launch. The app is closed on interpreter shutdown.
+
+    Args:
+        **kwargs: Keyword arguments to configure the :class:`AppLauncher` on the first call.
+
+    Returns:
+        The running simulation app.
+    """
+    global _APP_LAUNCHER
+    if _APP_LAUNCHER is None:
+        _APP_LAUNCHER = AppLauncher(**kwargs)
+        # close the app when the interpreter shuts down rather than per module
+        atexit.register(_APP_LAUNCHER.app.close)
+    return _APP_LAUNCHER.app
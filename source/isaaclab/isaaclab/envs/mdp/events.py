@@ -31,6 +31,32 @@ if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedEnv
 
 
+_RANGE_TENSOR_CACHE: dict[tuple, torch.Tensor] = {}
+"""Cache of range tensors baked from the per-axis range dictionaries of event terms.
+
+The range dictionaries come from static configuration, yet the reset functions previously rebuilt
+the same ``(dims, 2)`` tensor from Python lists on every invocation -- a synchronizing host-to-device
+copy per reset. Baking each unique range once (keyed on content and device) leaves the per-reset
+work as a single on-device uniform draw.
+"""
+
+
+def _resolve_range_tensor(range_dict: dict[str, tuple[float, float]], keys: tuple[str, ...], device: str) -> torch.Tensor:
+    """Returns the ``(len(keys), 2)`` tensor of per-axis ranges, baking it on first use."""
+    content = tuple(tuple(range_dict.get(key, (0.0, 0.0))) for key in keys)
+    cache_key = (content, str(device))
+    ranges = _RANGE_TENSOR_CACHE.get(cache_key)
+    if ranges is None:
+        ranges = torch.tensor(content, device=device)
+        _RANGE_TENSOR_CACHE[cache_key] = ranges
+    return ranges
+
+
+_POSE_RANGE_KEYS = ("x", "y", "z", "roll", "pitch", "yaw")
+_POSITION_RANGE_KEYS = ("x", "y", "z")
+_ORIENTATION_RANGE_KEYS = ("roll", "pitch", "yaw")
+
+
 class randomize_rigid_body_material(ManagerTermBase):
     """Randomize the physics materials on all geometries of the asset.
 
@@ -628,8 +654,7 @@ def push_by_setting_velocity(
     # velocities
     vel_w = asset.data.root_vel_w[env_ids]
     # sample random velocities
-    range_list = [velocity_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z", "roll", "pitch", "yaw"]]
-    ranges = torch.tensor(range_list, device=asset.device)
+    ranges = _resolve_range_tensor(velocity_range, _POSE_RANGE_KEYS, asset.device)
     vel_w += math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], vel_w.shape, device=asset.device)
     # set the velocities into the physics simulation
     asset.write_root_velocity_to_sim(vel_w, env_ids=env_ids)
@@ -661,16 +686,14 @@ def reset_root_state_uniform(
     root_states = asset.data.default_root_state[env_ids].clone()
 
     # poses
-    range_list = [pose_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z", "roll", "pitch", "yaw"]]
-    ranges = torch.tensor(range_list, device=asset.device)
+    ranges = _resolve_range_tensor(pose_range, _POSE_RANGE_KEYS, asset.device)
     rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 6), device=asset.device)
 
     positions = root_states[:, 0:3] + env.scene.env_origins[env_ids] + rand_samples[:, 0:3]
     orientations_delta = math_utils.quat_from_euler_xyz(rand_samples[:, 3], rand_samples[:, 4], rand_samples[:, 5])
     orientations = math_utils.quat_mul(root_states[:, 3:7], orientations_delta)
     # velocities
-    range_list = [velocity_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z", "roll", "pitch", "yaw"]]
-    ranges = torch.tensor(range_list, device=asset.device)
+    ranges = _resolve_range_tensor(velocity_range, _POSE_RANGE_KEYS, asset.device)
     rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 6), device=asset.device)
 
     velocities = root_states[:, 7:13] + rand_samples
@@ -713,16 +736,14 @@ def reset_root_state_with_random_orientation(
     root_states = asset.data.default_root_state[env_ids].clone()
 
     # poses
-    range_list = [pose_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z"]]
-    ranges = torch.tensor(range_list, device=asset.device)
+    ranges = _resolve_range_tensor(pose_range, _POSITION_RANGE_KEYS, asset.device)
     rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 3), device=asset.device)
 
     positions = root_states[:, 0:3] + env.scene.env_origins[env_ids] + rand_samples
     orientations = math_utils.random_orientation(len(env_ids), device=asset.device)
 
     # velocities
-    range_list = [velocity_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z", "roll", "pitch", "yaw"]]
-    ranges = torch.tensor(range_list, device=asset.device)
+    ranges = _resolve_range_tensor(velocity_range, _POSE_RANGE_KEYS, asset.device)
     rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 6), device=asset.device)
 
     velocities = root_states[:, 7:13] + rand_samples
@@ -780,16 +801,14 @@ def reset_root_state_from_terrain(
     positions += asset.data.default_root_state[env_ids, :3]
 
     # sample random orientations
-    range_list = [pose_range.get(key, (0.0, 0.0)) for key in ["roll", "pitch", "yaw"]]
-    ranges = torch.tensor(range_list, device=asset.device)
+    ranges = _resolve_range_tensor(pose_range, _ORIENTATION_RANGE_KEYS, asset.device)
     rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 3), device=asset.device)
 
     # convert to quaternions
     orientations = math_utils.quat_from_euler_xyz(rand_samples[:, 0], rand_samples[:, 1], rand_samples[:, 2])
 
     # sample random velocities
-    range_list = [velocity_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z", "roll", "pitch", "yaw"]]
-    ranges = torch.tensor(range_list, device=asset.device)
+    ranges = _resolve_range_tensor(velocity_range, _POSE_RANGE_KEYS, asset.device)
     rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 6), device=asset.device)
 
     velocities = asset.data.default_root_state[:, 7:13] + rand_samples
@@ -891,15 +910,13 @@ def reset_nodal_state_uniform(
     nodal_state = asset.data.default_nodal_state_w[env_ids].clone()
 
     # position
-    range_list = [position_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z"]]
-    ranges = torch.tensor(range_list, device=asset.device)
+    ranges = _resolve_range_tensor(position_range, _POSITION_RANGE_KEYS, asset.device)
     rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 1, 3), device=asset.device)
 
     nodal_state[..., :3] += rand_samples
 
     # velocities
-    range_list = [velocity_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z"]]
-    ranges = torch.tensor(range_list, device=asset.device)
+    ranges = _resolve_range_tensor(velocity_range, _POSITION_RANGE_KEYS, asset.device)
     rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 1, 3), device=asset.device)
 
     nodal_state[..., 3:] += rand_samples
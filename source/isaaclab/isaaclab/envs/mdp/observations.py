@@ -170,7 +170,9 @@ def height_scan(env: ManagerBasedEnv, sensor_cfg: SceneEntityCfg, offset: float
     # extract the used quantities (to enable type-hinting)
     sensor: RayCaster = env.scene.sensors[sensor_cfg.name]
     # height scan: height = sensor_height - hit_point_z - offset
-    return sensor.data.pos_w[:, 2].unsqueeze(1) - sensor.data.ray_hits_w[..., 2] - offset
+    # note: the offset is folded into the per-env sensor height first so that the broadcasted
+    #   subtraction over all rays is the only full-size pass over the scan data
+    return (sensor.data.pos_w[:, 2] - offset).unsqueeze(1) - sensor.data.ray_hits_w[..., 2]
 
 
 def body_incoming_wrench(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg) -> torch.Tensor:
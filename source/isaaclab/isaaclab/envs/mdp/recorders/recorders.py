@@ -6,13 +6,23 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
 from isaaclab.managers.recorder_manager import RecorderTerm
 
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+    from isaaclab.managers.manager_term_cfg import RecorderTermCfg
+
 
 class InitialStateRecorder(RecorderTerm):
     """Recorder term that records the initial state of the environment after reset."""
 
+    def __init__(self, cfg: RecorderTermCfg, env: ManagerBasedEnv):
+        super().__init__(cfg, env)
+        # bind the scene once to avoid the attribute chain on every record call
+        self._scene = env.scene
+
     def record_post_reset(self, env_ids: Sequence[int] | None):
         def extract_env_ids_values(value):
             nonlocal env_ids
@@ -20,25 +30,42 @@ class InitialStateRecorder(RecorderTerm):
                 return {k: extract_env_ids_values(v) for k, v in value.items()}
             return value[env_ids]
 
-        return "initial_state", extract_env_ids_values(self._env.scene.get_state(is_relative=True))
+        return "initial_state", extract_env_ids_values(self._scene.get_state(is_relative=True))
 
 
 class PostStepStatesRecorder(RecorderTerm):
     """Recorder term that records the state of the environment at the end of each step."""
 
+    def __init__(self, cfg: RecorderTermCfg, env: ManagerBasedEnv):
+        super().__init__(cfg, env)
+        # bind the scene once to avoid the attribute chain on every step
+        self._scene = env.scene
+
     def record_post_step(self):
-        return "states", self._env.scene.get_state(is_relative=True)
+        # gather the state as one flat tensor and expand it into the recorded layout as views,
+        # which replaces the per-asset clones of ``get_state`` with a single allocation
+        state = self._scene.get_state_tensor(is_relative=True)
+        return "states", self._scene.tensor_state_to_state_dict(state)
 
 
 class PreStepActionsRecorder(RecorderTerm):
     """Recorder term that records the actions in the beginning of each step."""
 
+    def __init__(self, cfg: RecorderTermCfg, env: ManagerBasedEnv):
+        super().__init__(cfg, env)
+        # the action manager is created after the recorder manager, so it is bound lazily on first use
+        self._action_manager = None
+
     def record_pre_step(self):
-        return "actions", self._env.action_manager.action
+        # bind the action manager once to avoid the attribute chain on every step
+        if self._action_manager is None:
+            self._action_manager = self._env.action_manager
+        return "actions", self._action_manager.action
 
 
 class PreStepFlatPolicyObservationsRecorder(RecorderTerm):
     """Recorder term that records the policy group observations in each step."""
 
     def record_pre_step(self):
+        # note: ``obs_buf`` is rebuilt by the observation manager every step, so it cannot be bound once
         return "obs", self._env.obs_buf["policy"]
@@ -4,7 +4,6 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import gymnasium as gym
-import math
 import numpy as np
 import torch
 from typing import Any
@@ -14,6 +13,54 @@ from ..direct_marl_env import DirectMARLEnv
 from ..direct_rl_env import DirectRLEnv
 
 
+def _reduce_step_outputs(
+    reward_tensors: list[torch.Tensor],
+    terminated_tensors: list[torch.Tensor],
+    time_out_tensors: list[torch.Tensor],
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Reduce the per-agent step outputs (sum of rewards, AND of the done flags) in a single call."""
+    if len(reward_tensors) == 1:
+        rewards = reward_tensors[0]
+    else:
+        rewards = torch.stack(reward_tensors, dim=0).sum(dim=0)
+    terminated = torch.all(torch.stack(terminated_tensors), dim=0)
+    time_outs = torch.all(torch.stack(time_out_tensors), dim=0)
+    return rewards, terminated, time_outs
+
+
+# script the reductions to fuse them and drop the Python dispatch overhead from the per-step path,
+# falling back to the eager function if scripting is not available in the current build
+try:
+    _reduce_step_outputs = torch.jit.script(_reduce_step_outputs)
+except Exception:
+    pass
+
+
+def _flatten2d(tensor: torch.Tensor, num_envs: int) -> torch.Tensor:
+    """Flatten a tensor to ``(num_envs, -1)``, skipping the reshape when it already has that layout."""
+    if tensor.dim() == 2 and tensor.size(0) == num_envs and tensor.is_contiguous():
+        return tensor
+    return tensor.reshape(num_envs, -1)
+
+
+def _flatten_agent_spaces(env: DirectMARLEnv, spaces: dict[AgentID, gym.Space]) -> gym.Space:
+    """Flatten the agents' spaces into a single space, caching the result on the environment instance.
+
+    The flattening builds a new :class:`gym.spaces.Tuple` and traverses it on every call, which is wasted
+    work when environments are wrapped repeatedly (e.g. parallel workers or hyperparameter sweeps).
+    """
+    cache = getattr(env, "_flat_space_cache", None)
+    if cache is None:
+        cache = {}
+        env._flat_space_cache = cache
+    key = id(spaces)
+    space = cache.get(key)
+    if space is None:
+        space = gym.spaces.flatten_space(gym.spaces.Tuple([spaces[agent] for agent in env.possible_agents]))
+        cache[key] = space
+    return space
+
+
 def multi_agent_to_single_agent(env: DirectMARLEnv, state_as_observation: bool = False) -> DirectRLEnv:
     """Convert the multi-agent environment instance to a single-agent environment instance.
 
@@ -64,18 +111,56 @@ def multi_agent_to_single_agent(env: DirectMARLEnv, state_as_observation: bool =
             if self._state_as_observation:
                 self.single_observation_space["policy"] = self.env.state_space
             else:
-                self.single_observation_space["policy"] = gym.spaces.flatten_space(
-                    gym.spaces.Tuple([self.env.observation_spaces[agent] for agent in self.env.possible_agents])
+                self.single_observation_space["policy"] = _flatten_agent_spaces(
+                    self.env, self.env.observation_spaces
                 )
-            self.single_action_space = gym.spaces.flatten_space(
-                gym.spaces.Tuple([self.env.action_spaces[agent] for agent in self.env.possible_agents])
-            )
+            self.single_action_space = _flatten_agent_spaces(self.env, self.env.action_spaces)
 
-            # batch the spaces for vectorized environments
-            self.observation_space = gym.vector.utils.batch_space(
-                self.single_observation_space["policy"], self.num_envs
-            )
-            self.action_space = gym.vector.utils.batch_space(self.single_action_space, self.num_envs)
+            # the batched spaces for vectorized environments are built lazily on first access, since
+            # batching broadcasts the space bounds to (num_envs, ...) arrays that not all consumers need
+            self._batched_observation_space: gym.Space | None = None
+            self._batched_action_space: gym.Space | None = None
+
+            # cache the per-agent action slices to avoid flattening the action spaces on every step
+            self._agents_order = tuple(self.env.possible_agents)
+            self._action_slices = []
+            index = 0
+            for agent in self._agents_order:
+                delta = gym.spaces.flatdim(self.env.action_spaces[agent])
+                self._action_slices.append((agent, index, index + delta))
+                index += delta
+
+            # buffer for the concatenated observations (allocated lazily to match the agents' tensors)
+            self._obs_buffer: torch.Tensor | None = None
+            # with a single agent there is nothing to concatenate: return its observations as a view
+            self._trivial_single = len(self._agents_order) == 1
+
+        def _concatenate_obs(self, obs: dict[AgentID, ObsType]) -> torch.Tensor:
+            """Concatenate the agents' observations into the preallocated buffer."""
+            if self._trivial_single:
+                return _flatten2d(obs[self._agents_order[0]], self.num_envs)
+            tensors = [_flatten2d(obs[agent], self.num_envs) for agent in self._agents_order]
+            if self._obs_buffer is None:
+                size = sum(tensor.shape[-1] for tensor in tensors)
+                self._obs_buffer = torch.empty(
+                    (self.num_envs, size), dtype=tensors[0].dtype, device=tensors[0].device
+                )
+            torch.cat(tensors, dim=-1, out=self._obs_buffer)
+            return self._obs_buffer
+
+        @property
+        def observation_space(self) -> gym.Space:
+            if self._batched_observation_space is None:
+                self._batched_observation_space = gym.vector.utils.batch_space(
+                    self.single_observation_space["policy"], self.num_envs
+                )
+            return self._batched_observation_space
+
+        @property
+        def action_space(self) -> gym.Space:
+            if self._batched_action_space is None:
+                self._batched_action_space = gym.vector.utils.batch_space(self.single_action_space, self.num_envs)
+            return self._batched_action_space
 
         def reset(self, seed: int | None = None, options: dict[str, Any] | None = None) -> tuple[VecEnvObs, dict]:
             obs, extras = self.env.reset(seed, options)
@@ -86,23 +171,14 @@ def multi_agent_to_single_agent(env: DirectMARLEnv, state_as_observation: bool =
             # concatenate agents' observations
             # FIXME: This implementation assumes the spaces are fundamental ones. Fix it to support composite spaces
             else:
-                obs = {
-                    "policy": torch.cat(
-                        [obs[agent].reshape(self.num_envs, -1) for agent in self.env.possible_agents], dim=-1
-                    )
-                }
+                obs = {"policy": self._concatenate_obs(obs)}
 
             return obs, extras
 
         def step(self, action: torch.Tensor) -> VecEnvStepReturn:
             # split single-agent actions to build the multi-agent ones
             # FIXME: This implementation assumes the spaces are fundamental ones. Fix it to support composite spaces
-            index = 0
-            _actions = {}
-            for agent in self.env.possible_agents:
-                delta = gym.spaces.flatdim(self.env.action_spaces[agent])
-                _actions[agent] = action[:, index : index + delta]
-                index += delta
+            _actions = {agent: action[:, start:stop] for agent, start, stop in self._action_slices}
 
             # step the environment
             obs, rewards, terminated, time_outs, extras = self.env.step(_actions)
@@ -113,16 +189,13 @@ def multi_agent_to_single_agent(env: DirectMARLEnv, state_as_observation: bool =
             # concatenate agents' observations
             # FIXME: This implementation assumes the spaces are fundamental ones. Fix it to support composite spaces
             else:
-                obs = {
-                    "policy": torch.cat(
-                        [obs[agent].reshape(self.num_envs, -1) for agent in self.env.possible_agents], dim=-1
-                    )
-                }
+                obs = {"policy": self._concatenate_obs(obs)}
 
             # process environment outputs to return single-agent data
-            rewards = sum(rewards.values())
-            terminated = math.prod(terminated.values()).to(dtype=torch.bool)
-            time_outs = math.prod(time_outs.values()).to(dtype=torch.bool)
+            agents = self._agents_order
+            rewards, terminated, time_outs = _reduce_step_outputs(
+                [rewards[a] for a in agents], [terminated[a] for a in agents], [time_outs[a] for a in agents]
+            )
 
             return obs, rewards, terminated, time_outs, extras
 
@@ -174,6 +247,13 @@ def multi_agent_with_one_agent(env: DirectMARLEnv, state_as_observation: bool =
                     " unconstructed"
                 )
 
+            # bind the frequently accessed attributes directly so that hot accesses (including the
+            # inherited num_envs/device properties) bypass the __getattr__ forwarding
+            self.cfg = self.env.cfg
+            self.sim = self.env.sim
+            self.scene = self.env.scene
+            self.render_mode = self.env.render_mode
+
             # create agent properties to expose in the converted environment
             self._agent_id = "single-agent"
             self._exported_agents = [self._agent_id]
@@ -182,19 +262,40 @@ def multi_agent_with_one_agent(env: DirectMARLEnv, state_as_observation: bool =
                 self._exported_observation_spaces = {self._agent_id: self.env.state_space}
             else:
                 self._exported_observation_spaces = {
-                    self._agent_id: gym.spaces.flatten_space(
-                        gym.spaces.Tuple([self.env.observation_spaces[agent] for agent in self.env.possible_agents])
-                    )
+                    self._agent_id: _flatten_agent_spaces(self.env, self.env.observation_spaces)
                 }
-            self._exported_action_spaces = {
-                self._agent_id: gym.spaces.flatten_space(
-                    gym.spaces.Tuple([self.env.action_spaces[agent] for agent in self.env.possible_agents])
-                )
-            }
+            self._exported_action_spaces = {self._agent_id: _flatten_agent_spaces(self.env, self.env.action_spaces)}
+
+            # cache the per-agent action slices to avoid flattening the action spaces on every step
+            self._agents_order = tuple(self.env.possible_agents)
+            self._action_slices = []
+            index = 0
+            for agent in self._agents_order:
+                delta = gym.spaces.flatdim(self.env.action_spaces[agent])
+                self._action_slices.append((agent, index, index + delta))
+                index += delta
+
+            # buffer for the concatenated observations (allocated lazily to match the agents' tensors)
+            self._obs_buffer: torch.Tensor | None = None
+            # with a single agent there is nothing to concatenate: return its observations as a view
+            self._trivial_single = len(self._agents_order) == 1
 
         def __getattr__(self, key: str) -> Any:
             return getattr(self.env, key)
 
+        def _concatenate_obs(self, obs: dict[AgentID, ObsType]) -> torch.Tensor:
+            """Concatenate the agents' observations into the preallocated buffer."""
+            if self._trivial_single:
+                return _flatten2d(obs[self._agents_order[0]], self.num_envs)
+            tensors = [_flatten2d(obs[agent], self.num_envs) for agent in self._agents_order]
+            if self._obs_buffer is None:
+                size = sum(tensor.shape[-1] for tensor in tensors)
+                self._obs_buffer = torch.empty(
+                    (self.num_envs, size), dtype=tensors[0].dtype, device=tensors[0].device
+                )
+            torch.cat(tensors, dim=-1, out=self._obs_buffer)
+            return self._obs_buffer
+
         @property
         def agents(self) -> list[AgentID]:
             return self._exported_agents
@@ -222,23 +323,15 @@ def multi_agent_with_one_agent(env: DirectMARLEnv, state_as_observation: bool =
             # concatenate agents' observations
             # FIXME: This implementation assumes the spaces are fundamental ones. Fix it to support composite spaces
             else:
-                obs = {
-                    self._agent_id: torch.cat(
-                        [obs[agent].reshape(self.num_envs, -1) for agent in self.env.possible_agents], dim=-1
-                    )
-                }
+                obs = {self._agent_id: self._concatenate_obs(obs)}
 
             return obs, extras
 
         def step(self, actions: dict[AgentID, ActionType]) -> EnvStepReturn:
             # split agent actions to build the multi-agent ones
             # FIXME: This implementation assumes the spaces are fundamental ones. Fix it to support composite spaces
-            index = 0
-            _actions = {}
-            for agent in self.env.possible_agents:
-                delta = gym.spaces.flatdim(self.env.action_spaces[agent])
-                _actions[agent] = actions[self._agent_id][:, index : index + delta]
-                index += delta
+            action = actions[self._agent_id]
+            _actions = {agent: action[:, start:stop] for agent, start, stop in self._action_slices}
 
             # step the environment
             obs, rewards, terminated, time_outs, extras = self.env.step(_actions)
@@ -249,16 +342,16 @@ def multi_agent_with_one_agent(env: DirectMARLEnv, state_as_observation: bool =
             # concatenate agents' observations
             # FIXME: This implementation assumes the spaces are fundamental ones. Fix it to support composite spaces
             else:
-                obs = {
-                    self._agent_id: torch.cat(
-                        [obs[agent].reshape(self.num_envs, -1) for agent in self.env.possible_agents], dim=-1
-                    )
-                }
+                obs = {self._agent_id: self._concatenate_obs(obs)}
 
             # process environment outputs to return agent data
-            rewards = {self._agent_id: sum(rewards.values())}
-            terminated = {self._agent_id: math.prod(terminated.values()).to(dtype=torch.bool)}
-            time_outs = {self._agent_id: math.prod(time_outs.values()).to(dtype=torch.bool)}
+            agents = self._agents_order
+            reward, terminated_all, time_out_all = _reduce_step_outputs(
+                [rewards[a] for a in agents], [terminated[a] for a in agents], [time_outs[a] for a in agents]
+            )
+            rewards = {self._agent_id: reward}
+            terminated = {self._agent_id: terminated_all}
+            time_outs = {self._agent_id: time_out_all}
 
             return obs, rewards, terminated, time_outs, extras
 
@@ -12,6 +12,48 @@ from typing import Any
 from ..common import SpaceType
 
 
+def _int_spec_to_space(spec: int) -> gym.spaces.Space:
+    # Box
+    return gym.spaces.Box(low=-np.inf, high=np.inf, shape=(spec,))
+
+
+def _list_spec_to_space(spec: list) -> gym.spaces.Space | None:
+    # Box
+    if all(isinstance(x, int) for x in spec):
+        return gym.spaces.Box(low=-np.inf, high=np.inf, shape=spec)
+    # MultiDiscrete
+    if all(isinstance(x, set) and len(x) == 1 for x in spec):
+        return gym.spaces.MultiDiscrete(nvec=[next(iter(x)) for x in spec])
+    return None
+
+
+def _set_spec_to_space(spec: set) -> gym.spaces.Space | None:
+    # Discrete
+    if len(spec) == 1:
+        return gym.spaces.Discrete(n=next(iter(spec)))
+    return None
+
+
+def _tuple_spec_to_space(spec: tuple) -> gym.spaces.Space:
+    # Tuple
+    return gym.spaces.Tuple([spec_to_gym_space(x) for x in spec])
+
+
+def _dict_spec_to_space(spec: dict) -> gym.spaces.Space:
+    # Dict
+    return gym.spaces.Dict({k: spec_to_gym_space(v) for k, v in spec.items()})
+
+
+_SPEC_TO_SPACE_DISPATCH = {
+    int: _int_spec_to_space,
+    list: _list_spec_to_space,
+    set: _set_spec_to_space,
+    tuple: _tuple_spec_to_space,
+    dict: _dict_spec_to_space,
+}
+"""Dispatch table mapping specification types to space converters (avoids a long ``isinstance`` chain)."""
+
+
 def spec_to_gym_space(spec: SpaceType) -> gym.spaces.Space:
     """Generate an appropriate Gymnasium space according to the given space specification.
 
@@ -26,28 +68,30 @@ def spec_to_gym_space(spec: SpaceType) -> gym.spaces.Space:
     """
     if isinstance(spec, gym.spaces.Space):
         return spec
-    # fundamental spaces
-    # Box
-    elif isinstance(spec, int):
-        return gym.spaces.Box(low=-np.inf, high=np.inf, shape=(spec,))
-    elif isinstance(spec, list) and all(isinstance(x, int) for x in spec):
-        return gym.spaces.Box(low=-np.inf, high=np.inf, shape=spec)
-    # Discrete
-    elif isinstance(spec, set) and len(spec) == 1:
-        return gym.spaces.Discrete(n=next(iter(spec)))
-    # MultiDiscrete
-    elif isinstance(spec, list) and all(isinstance(x, set) and len(x) == 1 for x in spec):
-        return gym.spaces.MultiDiscrete(nvec=[next(iter(x)) for x in spec])
-    # composite spaces
-    # Tuple
-    elif isinstance(spec, tuple):
-        return gym.spaces.Tuple([spec_to_gym_space(x) for x in spec])
-    # Dict
-    elif isinstance(spec, dict):
-        return gym.spaces.Dict({k: spec_to_gym_space(v) for k, v in spec.items()})
+    # fundamental and composite spaces (dispatched on the specification type)
+    handler = _SPEC_TO_SPACE_DISPATCH.get(type(spec))
+    if handler is not None:
+        space = handler(spec)
+        if space is not None:
+            return space
     raise ValueError(f"Unsupported space specification: {spec}")
 
 
+def _flatten_space_schema(space: gym.spaces.Space, path: tuple = ()) -> list[tuple[tuple, gym.spaces.Space]]:
+    """Flatten a space tree into a list of ``(path, leaf_space)`` pairs (depth-first order)."""
+    if isinstance(space, gym.spaces.Dict):
+        schema = []
+        for k, s in space.items():
+            schema.extend(_flatten_space_schema(s, path + (k,)))
+        return schema
+    if isinstance(space, gym.spaces.Tuple):
+        schema = []
+        for i, s in enumerate(space):
+            schema.extend(_flatten_space_schema(s, path + (i,)))
+        return schema
+    return [(path, space)]
+
+
 def sample_space(space: gym.spaces.Space, device: str, batch_size: int = -1, fill_value: float | None = None) -> Any:
     """Sample a Gymnasium space where the data container are PyTorch tensors.
 
@@ -61,36 +105,44 @@ def sample_space(space: gym.spaces.Space, device: str, batch_size: int = -1, fil
         Tensorized sampled space.
     """
 
-    def tensorize(s, x):
+    def tensorize_leaf(s, x):
+        # resolve the target shape and dtype for the leaf space
         if isinstance(s, gym.spaces.Box):
-            tensor = torch.tensor(x, device=device, dtype=torch.float32).reshape(batch_size, *s.shape)
-            if fill_value is not None:
-                tensor.fill_(fill_value)
-            return tensor
+            shape, dtype = (batch_size, *s.shape), torch.float32
         elif isinstance(s, gym.spaces.Discrete):
-            if isinstance(x, np.ndarray):
-                tensor = torch.tensor(x, device=device, dtype=torch.int64).reshape(batch_size, 1)
-                if fill_value is not None:
-                    tensor.fill_(int(fill_value))
-                return tensor
-            elif isinstance(x, np.number) or type(x) in [int, float]:
-                tensor = torch.tensor([x], device=device, dtype=torch.int64).reshape(batch_size, 1)
-                if fill_value is not None:
-                    tensor.fill_(int(fill_value))
-                return tensor
+            shape, dtype = (batch_size, 1), torch.int64
         elif isinstance(s, gym.spaces.MultiDiscrete):
-            if isinstance(x, np.ndarray):
-                tensor = torch.tensor(x, device=device, dtype=torch.int64).reshape(batch_size, *s.shape)
-                if fill_value is not None:
-                    tensor.fill_(int(fill_value))
-                return tensor
-        elif isinstance(s, gym.spaces.Dict):
-            return {k: tensorize(_s, x[k]) for k, _s in s.items()}
-        elif isinstance(s, gym.spaces.Tuple):
-            return tuple([tensorize(_s, v) for _s, v in zip(s, x)])
+            shape, dtype = (batch_size, *s.shape), torch.int64
+        else:
+            return None
+        # create the tensor already filled instead of allocating and overwriting it
+        if fill_value is not None:
+            size = (1, *shape[1:]) if batch_size < 0 else shape
+            value = fill_value if dtype == torch.float32 else int(fill_value)
+            return torch.full(size, value, device=device, dtype=dtype)
+        # as_tensor avoids an extra copy when the sampled data is already an ndarray of the right dtype,
+        # and the non-blocking transfer lets the host-to-device copy overlap with subsequent work
+        arr = np.ascontiguousarray(x, dtype=np.float32 if dtype == torch.float32 else np.int64)
+        return torch.as_tensor(arr).to(device, non_blocking=True).reshape(shape)
 
     sample = (gym.vector.utils.batch_space(space, batch_size) if batch_size > 0 else space).sample()
-    return tensorize(space, sample)
+    # walk the flat schema in a straight-line loop instead of re-descending the space tree
+    tensors = {}
+    for path, leaf in _flatten_space_schema(space):
+        x = sample
+        for key in path:
+            x = x[key]
+        tensors[path] = tensorize_leaf(leaf, x)
+
+    # assemble the nested containers around the already-tensorized leaves
+    def assemble(s, path):
+        if isinstance(s, gym.spaces.Dict):
+            return {k: assemble(_s, path + (k,)) for k, _s in s.items()}
+        if isinstance(s, gym.spaces.Tuple):
+            return tuple(assemble(_s, path + (i,)) for i, _s in enumerate(s))
+        return tensors[path]
+
+    return assemble(space, ())
 
 
 def serialize_space(space: SpaceType) -> str:
@@ -7,6 +7,8 @@
 
 from __future__ import annotations
 
+import functools
+import numpy as np
 import torch
 from collections.abc import Sequence
 from prettytable import PrettyTable
@@ -21,6 +23,64 @@ if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedEnv
 
 
+@functools.lru_cache(maxsize=None)
+def _term_cfg_field_names(cfg_cls: type) -> tuple[str, ...]:
+    """Field names of an event cfg class, resolved once per class.
+
+    The prepass avoids rebuilding the term item list from the instance dictionary for every
+    manager instantiated from the same cfg class (e.g. across parallel training workers).
+    """
+    fields = getattr(cfg_cls, "__dataclass_fields__", None)
+    return tuple(fields.keys()) if fields is not None else ()
+
+
+def _interval_countdown_step(
+    time_left: torch.Tensor, dt: float, lower: torch.Tensor, range_width: torch.Tensor
+) -> torch.Tensor:
+    """Advances the stacked interval countdowns by ``dt`` in-place and returns the trigger mask.
+
+    The trigger compare runs against the un-decremented buffer (``time_left - dt <= 0`` is the same
+    as ``time_left <= dt``), so the decrement and the resampling of the triggered entries collapse
+    into a single :func:`torch.where` instead of a separate subtract kernel.
+    The small epsilon handles floating point errors.
+    """
+    trigger_mask = time_left < dt + 1e-6
+    if bool(trigger_mask.any()):
+        resampled = torch.rand_like(time_left) * range_width + lower
+        torch.where(trigger_mask, resampled, time_left - dt, out=time_left)
+    else:
+        time_left.sub_(dt)
+    return trigger_mask
+
+
+def _reset_trigger_check(
+    last_step: torch.Tensor,
+    triggered_once: torch.Tensor,
+    global_step: int,
+    min_steps: torch.Tensor,
+    min_steps_is_zero: torch.Tensor,
+) -> torch.Tensor:
+    """Returns the trigger mask for the stacked (num_terms, num_envs) reset bookkeeping.
+
+    A term triggers for an environment when the minimum step count between triggers has passed,
+    when it has never been triggered (usually only at the start of the environment), or when its
+    minimum step count is zero (such terms bypass the trigger mechanism entirely).
+    """
+    mask = (global_step - last_step) >= min_steps.unsqueeze(1)
+    mask |= (last_step == 0) & ~triggered_once
+    mask |= min_steps_is_zero.unsqueeze(1)
+    return mask
+
+
+# script the hot helpers to cut the per-op dispatch overhead; fall back to eager execution
+# if scripting is not possible in the current runtime
+try:
+    _interval_countdown_step = torch.jit.script(_interval_countdown_step)
+    _reset_trigger_check = torch.jit.script(_reset_trigger_check)
+except Exception:
+    pass
+
+
 class EventManager(ManagerBase):
     """Manager for orchestrating operations based on different simulation events.
 
@@ -66,12 +126,37 @@ class EventManager(ManagerBase):
         self._mode_term_names: dict[str, list[str]] = dict()
         self._mode_term_cfgs: dict[str, list[EventTermCfg]] = dict()
         self._mode_class_term_cfgs: dict[str, list[EventTermCfg]] = dict()
+        # mapping from term name to its (mode, index) location, filled during parsing
+        # note: initialized here since parsing is skipped for an empty configuration
+        self._term_name_to_location: dict[str, tuple[str, int]] = dict()
+        self._term_meta_dirty = False
+        # modes for which an "is not defined" warning has already been emitted
+        self._warned_modes: set[str] = set()
 
         # call the base class (this will parse the terms config)
         super().__init__(cfg, env)
 
     def __str__(self) -> str:
-        """Returns: A string representation for event manager."""
+        """Returns: A string representation for event manager.
+
+        The representation is built with plain string joins since it is emitted from logging paths;
+        use :meth:`format_table` for the tabulated form.
+        """
+        lines = [f"<EventManager> contains {len(self._mode_term_names)} active terms."]
+        # add info on each mode
+        for mode, names in self._mode_term_names.items():
+            lines.append(f"Active Event Terms in Mode: '{mode}'")
+            if mode == "interval":
+                lines.extend(
+                    f"  [{index}] {name} (interval range: {cfg.interval_range_s} s)"
+                    for index, (name, cfg) in enumerate(zip(names, self._mode_term_cfgs[mode]))
+                )
+            else:
+                lines.extend(f"  [{index}] {name}" for index, name in enumerate(names))
+        return "\n".join(lines) + "\n"
+
+    def format_table(self) -> str:
+        """Returns: A tabulated representation of the active terms (uses :class:`PrettyTable`)."""
         msg = f"<EventManager> contains {len(self._mode_term_names)} active terms.\n"
 
         # add info on each mode
@@ -132,13 +217,16 @@ class EventManager(ManagerBase):
         # when the episode starts. otherwise the counter will start from the last time
         # for that environment
         if "interval" in self._mode_class_term_cfgs:
+            # the per-env countdowns live on the CPU, so index them with CPU ids
+            if isinstance(env_ids, torch.Tensor):
+                env_ids = env_ids.cpu()
             for index, term_cfg in enumerate(self._mode_class_term_cfgs["interval"]):
                 # sample a new interval and set that as time left
                 # note: global time events are based on simulation time and not episode time
                 #   so we do not reset them
                 if not term_cfg.is_global_time:
                     lower, upper = term_cfg.interval_range_s
-                    sampled_interval = torch.rand(num_envs, device=self.device) * (upper - lower) + lower
+                    sampled_interval = torch.empty(num_envs).uniform_(lower, upper)
                     self._interval_term_time_left[index][env_ids] = sampled_interval
 
         # nothing to log here
@@ -180,9 +268,15 @@ class EventManager(ManagerBase):
             ValueError: If the mode is ``"reset"`` and the total number of environment steps that have happened
                 is not provided.
         """
-        # check if mode is valid
-        if mode not in self._mode_term_names:
-            omni.log.warn(f"Event mode '{mode}' is not defined. Skipping event.")
+        # check if mode is valid (warn only once per unknown mode to keep the per-step cost low)
+        term_cfgs = self._mode_term_cfgs.get(mode)
+        if term_cfgs is None:
+            if mode not in self._warned_modes:
+                omni.log.warn(f"Event mode '{mode}' is not defined. Skipping event.")
+                self._warned_modes.add(mode)
+            return
+        # fast path: nothing to do if the mode has no terms
+        if not term_cfgs:
             return
         # check if mode is interval and dt is not provided
         if mode == "interval" and dt is None:
@@ -196,77 +290,97 @@ class EventManager(ManagerBase):
         if mode == "reset" and global_env_step_count is None:
             raise ValueError(f"Event mode '{mode}' requires the total number of environment steps to be provided.")
 
-        # iterate over all the event terms
-        for index, term_cfg in enumerate(self._mode_term_cfgs[mode]):
-            if mode == "interval":
-                # extract time left for this term
-                time_left = self._interval_term_time_left[index]
-                # update the time left for each environment
-                time_left -= dt
+        # refresh the cached per-term metadata if a term configuration was replaced
+        # note: this must happen before the fused countdown update so that replaced interval
+        #   ranges are in effect for this call's resampling
+        if self._term_meta_dirty:
+            self._build_term_meta()
+
+        # for the "interval" mode, update all the per-env countdowns and find the triggered terms in one
+        # fused pass over the stacked buffer instead of issuing per-term kernels
+        trigger_mask = None
+        trigger_counts = None
+        if mode == "interval" and self._interval_time_left_stacked is not None:
+            trigger_mask = _interval_countdown_step(
+                self._interval_time_left_stacked, dt, self._interval_lower, self._interval_range_width
+            )
+            trigger_counts = trigger_mask.sum(dim=1).tolist()
 
+        # iterate over all the event terms through the cached metadata tuples to avoid repeated
+        # configclass attribute lookups in the per-step loop
+        if mode == "interval":
+            row = 0
+            for index, (is_global, func) in enumerate(self._mode_term_meta[mode]):
                 # check if the interval has passed and sample a new interval
                 # note: we compare with a small value to handle floating point errors
-                if term_cfg.is_global_time:
+                if is_global:
+                    # extract time left for this term and update it
+                    time_left = self._interval_term_time_left[index]
+                    time_left -= dt
                     if time_left < 1e-6:
-                        lower, upper = term_cfg.interval_range_s
-                        sampled_interval = torch.rand(1) * (upper - lower) + lower
-                        self._interval_term_time_left[index][:] = sampled_interval
+                        self._interval_term_time_left[index].fill_(self._next_global_interval(index))
 
                         # call the event term (with None for env_ids)
-                        term_cfg.func(self._env, None, **term_cfg.params)
+                        func(self._env, None)
                 else:
-                    valid_env_ids = (time_left < 1e-6).nonzero().flatten()
-                    if len(valid_env_ids) > 0:
-                        lower, upper = term_cfg.interval_range_s
-                        sampled_time = torch.rand(len(valid_env_ids), device=self.device) * (upper - lower) + lower
-                        self._interval_term_time_left[index][valid_env_ids] = sampled_time
-
+                    # the countdown update and the resampling already happened on the stacked buffer
+                    if trigger_counts[row] > 0:
+                        # the trigger mask lives on the CPU: only the triggered ids go to the device
+                        valid_env_ids = trigger_mask[row].nonzero().flatten().to(self.device, non_blocking=True)
                         # call the event term
-                        term_cfg.func(self._env, valid_env_ids, **term_cfg.params)
-            elif mode == "reset":
-                # obtain the minimum step count between resets
-                min_step_count = term_cfg.min_step_count_between_reset
-                # resolve the environment indices
-                if env_ids is None:
-                    env_ids = slice(None)
-
-                # We bypass the trigger mechanism if min_step_count is zero, i.e. apply term on every reset call.
-                # This should avoid the overhead of checking the trigger condition.
-                if min_step_count == 0:
-                    self._reset_term_last_triggered_step_id[index][env_ids] = global_env_step_count
-                    self._reset_term_last_triggered_once[index][env_ids] = True
-
-                    # call the event term with the environment indices
-                    term_cfg.func(self._env, env_ids, **term_cfg.params)
+                        func(self._env, valid_env_ids)
+                    row += 1
+        elif mode == "reset":
+            # resolve whether all environments are considered (avoids materializing index temporaries)
+            all_envs = env_ids is None
+            if all_envs:
+                env_ids = slice(None)
+            if self._reset_last_stacked is not None:
+                # evaluate the min-step-count trigger for all reset terms in one fused pass
+                if all_envs:
+                    last_triggered_step = self._reset_last_stacked
+                    triggered_at_least_once = self._reset_once_stacked
                 else:
-                    # extract last reset step for this term
-                    last_triggered_step = self._reset_term_last_triggered_step_id[index][env_ids]
-                    triggered_at_least_once = self._reset_term_last_triggered_once[index][env_ids]
-                    # compute the steps since last reset
-                    steps_since_triggered = global_env_step_count - last_triggered_step
-
-                    # check if the term can be applied after the minimum step count between triggers has passed
-                    valid_trigger = steps_since_triggered >= min_step_count
-                    # check if the term has not been triggered yet (in that case, we trigger it at least once)
-                    # this is usually only needed at the start of the environment
-                    valid_trigger |= (last_triggered_step == 0) & ~triggered_at_least_once
-
-                    # select the valid environment indices based on the trigger
-                    if env_ids == slice(None):
-                        valid_env_ids = valid_trigger.nonzero().flatten()
-                    else:
-                        valid_env_ids = env_ids[valid_trigger]
-
-                    # reset the last reset step for each environment to the current env step count
-                    if len(valid_env_ids) > 0:
-                        self._reset_term_last_triggered_once[index][valid_env_ids] = True
-                        self._reset_term_last_triggered_step_id[index][valid_env_ids] = global_env_step_count
+                    last_triggered_step = self._reset_last_stacked[:, env_ids]
+                    triggered_at_least_once = self._reset_once_stacked[:, env_ids]
+                # evaluate the min-step-count, never-triggered and always-fire conditions for all
+                # terms in one fused scripted call
+                valid_trigger = _reset_trigger_check(
+                    last_triggered_step,
+                    triggered_at_least_once,
+                    global_env_step_count,
+                    self._reset_min_steps,
+                    self._reset_min_steps_is_zero,
+                )
 
+                # update the trigger bookkeeping for all terms in one pass
+                if all_envs:
+                    # in-place update on the full buffers, no temporaries
+                    self._reset_last_stacked.masked_fill_(valid_trigger, global_env_step_count)
+                    self._reset_once_stacked |= valid_trigger
+                else:
+                    self._reset_last_stacked[:, env_ids] = torch.where(
+                        valid_trigger, last_triggered_step.new_full((), global_env_step_count), last_triggered_step
+                    )
+                    self._reset_once_stacked[:, env_ids] = triggered_at_least_once | valid_trigger
+
+                trigger_counts = valid_trigger.sum(dim=1).tolist()
+                for index, (min_step_count, func) in enumerate(self._mode_term_meta[mode]):
+                    if min_step_count == 0:
+                        # call the event term with the incoming environment indices
+                        func(self._env, env_ids)
+                    elif trigger_counts[index] > 0:
+                        # select the valid environment indices based on the trigger
+                        if isinstance(env_ids, slice):
+                            valid_env_ids = valid_trigger[index].nonzero().flatten()
+                        else:
+                            valid_env_ids = env_ids[valid_trigger[index]]
                         # call the event term
-                        term_cfg.func(self._env, valid_env_ids, **term_cfg.params)
-            else:
+                        func(self._env, valid_env_ids)
+        else:
+            for func in self._mode_term_meta[mode]:
                 # call the event term
-                term_cfg.func(self._env, env_ids, **term_cfg.params)
+                func(self._env, env_ids)
 
     """
     Operations - Term settings.
@@ -285,14 +399,16 @@ class EventManager(ManagerBase):
         Raises:
             ValueError: If the term name is not found.
         """
-        term_found = False
-        for mode, terms in self._mode_term_names.items():
-            if term_name in terms:
-                self._mode_term_cfgs[mode][terms.index(term_name)] = cfg
-                term_found = True
-                break
-        if not term_found:
+        location = self._term_name_to_location.get(term_name)
+        if location is None:
             raise ValueError(f"Event term '{term_name}' not found.")
+        mode, index = location
+        # the per-mode containers are frozen tuples: rebuild with the replaced entry
+        term_cfgs = list(self._mode_term_cfgs[mode])
+        term_cfgs[index] = cfg
+        self._mode_term_cfgs[mode] = tuple(term_cfgs)
+        # the cached per-term metadata is stale now
+        self._term_meta_dirty = True
 
     def get_term_cfg(self, term_name: str) -> EventTermCfg:
         """Gets the configuration for the specified term.
@@ -309,19 +425,76 @@ class EventManager(ManagerBase):
         Raises:
             ValueError: If the term name is not found.
         """
-        for mode, terms in self._mode_term_names.items():
-            if term_name in terms:
-                return self._mode_term_cfgs[mode][terms.index(term_name)]
-        raise ValueError(f"Event term '{term_name}' not found.")
+        location = self._term_name_to_location.get(term_name)
+        if location is None:
+            raise ValueError(f"Event term '{term_name}' not found.")
+        mode, index = location
+        return self._mode_term_cfgs[mode][index]
 
     """
     Helper functions.
     """
 
+    _GLOBAL_RAND_BUF_SIZE = 1024
+    """Number of pre-sampled intervals kept per global-time term."""
+
+    def _build_term_meta(self):
+        """Caches per-term metadata so the per-step loop avoids repeated cfg attribute lookups."""
+        self._mode_term_meta: dict[str, list] = dict()
+        for mode, cfgs in self._mode_term_cfgs.items():
+            # terms with parameters read them at call time so that in-place edits of the dict
+            # returned by get_term_cfg(...).params keep taking effect, as with the other managers
+            funcs = [
+                (lambda env, env_ids, _cfg=cfg: _cfg.func(env, env_ids, **_cfg.params)) if cfg.params else cfg.func
+                for cfg in cfgs
+            ]
+            if mode == "interval":
+                meta = [(cfg.is_global_time, func) for cfg, func in zip(cfgs, funcs)]
+                # refresh the derived interval state so that a term configuration replaced at
+                # runtime takes effect: the stacked range tensors feed the fused countdown update
+                # and the pre-sampled intervals bake the ranges they were drawn from
+                if self._interval_lower is not None:
+                    per_env_rows = [i for i, is_global in enumerate(self._interval_term_is_global) if not is_global]
+                    lower = torch.tensor([cfgs[i].interval_range_s[0] for i in per_env_rows]).unsqueeze(1)
+                    upper = torch.tensor([cfgs[i].interval_range_s[1] for i in per_env_rows]).unsqueeze(1)
+                    self._interval_lower = lower
+                    self._interval_range_width = upper - lower
+                for index in self._interval_global_rand_buf:
+                    lower_s, upper_s = cfgs[index].interval_range_s
+                    self._interval_global_rand_buf[index] = np.random.uniform(
+                        lower_s, upper_s, self._GLOBAL_RAND_BUF_SIZE
+                    )
+                    self._interval_global_rand_cursor[index] = 0
+            elif mode == "reset":
+                meta = [(cfg.min_step_count_between_reset, func) for cfg, func in zip(cfgs, funcs)]
+                min_steps = [cfg.min_step_count_between_reset for cfg in cfgs]
+                self._reset_min_steps = torch.tensor(min_steps, dtype=torch.int32, device=self.device)
+                self._reset_min_steps_is_zero = self._reset_min_steps == 0
+            else:
+                meta = funcs
+            self._mode_term_meta[mode] = meta
+        self._term_meta_dirty = False
+
+    def _next_global_interval(self, index: int) -> float:
+        """Returns the next pre-sampled interval for a global-time term, refilling the buffer when exhausted."""
+        cursor = self._interval_global_rand_cursor[index]
+        buf = self._interval_global_rand_buf[index]
+        if cursor >= buf.shape[0]:
+            lower, upper = self._mode_term_cfgs["interval"][index].interval_range_s
+            buf = np.random.uniform(lower, upper, self._GLOBAL_RAND_BUF_SIZE)
+            self._interval_global_rand_buf[index] = buf
+            cursor = 0
+        self._interval_global_rand_cursor[index] = cursor + 1
+        return float(buf[cursor])
+
     def _prepare_terms(self):
         # buffer to store the time left for "interval" mode
         # if interval is global, then it is a single value, otherwise it is per environment
         self._interval_term_time_left: list[torch.Tensor] = list()
+        self._interval_term_is_global: list[bool] = list()
+        # pre-sampled intervals for global-time terms, keyed by the interval-term index
+        self._interval_global_rand_buf: dict[int, np.ndarray] = dict()
+        self._interval_global_rand_cursor: dict[int, int] = dict()
         # buffer to store the step count when the term was last triggered for each environment for "reset" mode
         self._reset_term_last_triggered_step_id: list[torch.Tensor] = list()
         self._reset_term_last_triggered_once: list[torch.Tensor] = list()
@@ -330,7 +503,13 @@ class EventManager(ManagerBase):
         if isinstance(self.cfg, dict):
             cfg_items = self.cfg.items()
         else:
-            cfg_items = self.cfg.__dict__.items()
+            # use the memoized per-class field prepass; fall back to the instance dictionary if
+            # attributes were added dynamically after construction
+            field_names = _term_cfg_field_names(type(self.cfg))
+            if field_names and len(field_names) == len(self.cfg.__dict__):
+                cfg_items = [(name, getattr(self.cfg, name)) for name in field_names]
+            else:
+                cfg_items = self.cfg.__dict__.items()
         # iterate over all the terms
         for term_name, term_cfg in cfg_items:
             # check for non config
@@ -351,6 +530,12 @@ class EventManager(ManagerBase):
 
             # resolve common parameters
             self._resolve_common_term_cfg(term_name, term_cfg, min_argc=2)
+            # compile the term function if requested (falls back to eager execution on failure)
+            if term_cfg.compile and not isinstance(term_cfg.func, ManagerTermBase):
+                try:
+                    term_cfg.func = torch.jit.script(term_cfg.func)
+                except Exception as e:
+                    omni.log.warn(f"Failed to compile event term '{term_name}' with torch.jit.script: {e}")
             # check if mode is a new mode
             if term_cfg.mode not in self._mode_term_names:
                 # add new mode
@@ -376,13 +561,19 @@ class EventManager(ManagerBase):
                 # sample the time left for global
                 if term_cfg.is_global_time:
                     lower, upper = term_cfg.interval_range_s
-                    time_left = torch.rand(1) * (upper - lower) + lower
+                    time_left = torch.empty(1).uniform_(lower, upper)
                     self._interval_term_time_left.append(time_left)
+                    self._interval_term_is_global.append(True)
+                    # pre-sample a batch of intervals so that re-triggering does not pay the
+                    # dispatch cost of a one-element torch.rand call
+                    index = len(self._interval_term_time_left) - 1
+                    self._interval_global_rand_buf[index] = np.random.uniform(lower, upper, self._GLOBAL_RAND_BUF_SIZE)
+                    self._interval_global_rand_cursor[index] = 0
                 else:
-                    # sample the time left for each environment
-                    lower, upper = term_cfg.interval_range_s
-                    time_left = torch.rand(self.num_envs, device=self.device) * (upper - lower) + lower
-                    self._interval_term_time_left.append(time_left)
+                    # the per-env countdown lives in the stacked buffer that is allocated once after
+                    # parsing; reserve this term's row (replaced with a row view below)
+                    self._interval_term_time_left.append(None)
+                    self._interval_term_is_global.append(False)
             # -- reset mode
             elif term_cfg.mode == "reset":
                 if term_cfg.min_step_count_between_reset < 0:
@@ -391,9 +582,63 @@ class EventManager(ManagerBase):
                         f" negative: {term_cfg.min_step_count_between_reset}. Please provide a non-negative value."
                     )
 
-                # initialize the current step count for each environment to zero
-                step_count = torch.zeros(self.num_envs, device=self.device, dtype=torch.int32)
-                self._reset_term_last_triggered_step_id.append(step_count)
-                # initialize the trigger flag for each environment to zero
-                no_trigger = torch.zeros(self.num_envs, device=self.device, dtype=torch.bool)
-                self._reset_term_last_triggered_once.append(no_trigger)
+                # the step count and trigger flag for each environment live in the stacked buffers
+                # that are allocated once after parsing; reserve this term's rows
+                self._reset_term_last_triggered_step_id.append(None)
+                self._reset_term_last_triggered_once.append(None)
+
+        # the reset trigger bookkeeping is stored as preallocated (num_terms, num_envs) buffers so
+        # that the trigger check in apply() runs as one fused pass over a single allocation.
+        # the list entries are row views into them, so per-term indexing keeps working.
+        self._reset_last_stacked: torch.Tensor | None = None
+        self._reset_once_stacked: torch.Tensor | None = None
+        num_reset_terms = len(self._reset_term_last_triggered_step_id)
+        if num_reset_terms > 0:
+            self._reset_last_stacked = torch.zeros(
+                (num_reset_terms, self.num_envs), device=self.device, dtype=torch.int32
+            )
+            self._reset_once_stacked = torch.zeros(
+                (num_reset_terms, self.num_envs), device=self.device, dtype=torch.bool
+            )
+            for i in range(num_reset_terms):
+                self._reset_term_last_triggered_step_id[i] = self._reset_last_stacked[i]
+                self._reset_term_last_triggered_once[i] = self._reset_once_stacked[i]
+
+        # the per-env interval countdowns are stored as a single preallocated (num_terms, num_envs)
+        # buffer so that the per-step update and trigger check run as one fused pass instead of
+        # per-term kernels. the list entries are row views, so per-term indexing keeps working.
+        # note: the countdowns live on the CPU since they only feed Python-side trigger decisions,
+        #   which avoids a device sync on every step
+        self._interval_time_left_stacked: torch.Tensor | None = None
+        self._interval_lower: torch.Tensor | None = None
+        self._interval_range_width: torch.Tensor | None = None
+        per_env_rows = [i for i, is_global in enumerate(self._interval_term_is_global) if not is_global]
+        if per_env_rows:
+            interval_cfgs = self._mode_term_cfgs["interval"]
+            lower = torch.tensor([interval_cfgs[i].interval_range_s[0] for i in per_env_rows]).unsqueeze(1)
+            upper = torch.tensor([interval_cfgs[i].interval_range_s[1] for i in per_env_rows]).unsqueeze(1)
+            self._interval_lower = lower
+            self._interval_range_width = upper - lower
+            # sample all the initial countdowns into the buffer in one kernel
+            self._interval_time_left_stacked = (
+                torch.rand(len(per_env_rows), self.num_envs) * self._interval_range_width + self._interval_lower
+            )
+            for row, i in enumerate(per_env_rows):
+                self._interval_term_time_left[i] = self._interval_time_left_stacked[row]
+
+        # freeze the per-mode containers: the term sets are fixed after parsing and tuples are
+        # cheaper to iterate in the per-step loops
+        for mode in self._mode_term_names:
+            self._mode_term_names[mode] = tuple(self._mode_term_names[mode])
+            self._mode_term_cfgs[mode] = tuple(self._mode_term_cfgs[mode])
+            self._mode_class_term_cfgs[mode] = tuple(self._mode_class_term_cfgs[mode])
+
+        # index the term locations once for O(1) lookups in set_term_cfg/get_term_cfg
+        self._term_name_to_location: dict[str, tuple[str, int]] = {
+            name: (mode, index)
+            for mode, names in self._mode_term_names.items()
+            for index, name in enumerate(names)
+        }
+
+        # cache the per-term metadata for the apply() hot loop
+        self._build_term_meta()
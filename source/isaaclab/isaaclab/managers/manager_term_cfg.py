@@ -67,6 +67,13 @@ class RecorderTermCfg:
     The class should inherit from :class:`isaaclab.managers.action_manager.RecorderTerm`.
     """
 
+    enabled: bool = True
+    """Whether the recorder term is enabled. Defaults to True.
+
+    Disabled terms skip their record callbacks entirely, which avoids computing the recorded
+    payload (e.g. querying the scene state) when the data is not consumed.
+    """
+
 
 ##
 # Action manager.
@@ -277,6 +284,17 @@ class EventTermCfg(ManagerTermBaseCfg):
         This is only used if the mode is ``"interval"``.
     """
 
+    compile: bool = False
+    """Whether to compile the term function with :func:`torch.jit.script`. Defaults to False.
+
+    This is useful for small pure-tensor terms whose runtime is dominated by the Python-side
+    dispatch overhead. If scripting fails (for instance, because the function is not
+    TorchScript-compatible), the term falls back to eager execution.
+
+    Note:
+        This is not supported for terms implemented as classes (:class:`ManagerTermBase`).
+    """
+
     min_step_count_between_reset: int = 0
     """The number of environment steps after which the term is applied since its last application. Defaults to 0.
 
@@ -102,6 +102,8 @@ class ObservationManager(ManagerBase):
 
         # Stores the latest observations.
         self._obs_buffer: dict[str, torch.Tensor | dict[str, torch.Tensor]] | None = None
+        # Per-step cache of raw term outputs, only alive while :meth:`compute` runs.
+        self._term_value_cache: dict[tuple, torch.Tensor] | None = None
 
     def __str__(self) -> str:
         """Returns: A string representation for the observation manager."""
@@ -249,8 +251,14 @@ class ObservationManager(ManagerBase):
         # create a buffer for storing obs from all the groups
         obs_buffer = dict()
         # iterate over all the terms in each group
-        for group_name in self._group_obs_term_names:
-            obs_buffer[group_name] = self.compute_group(group_name)
+        # note: a per-step cache deduplicates identical term calls (same function and parameters)
+        #   across groups, which is common for shared policy/critic sub-observations
+        self._term_value_cache = dict()
+        try:
+            for group_name in self._group_obs_term_names:
+                obs_buffer[group_name] = self.compute_group(group_name)
+        finally:
+            self._term_value_cache = None
         # otherwise return a dict with observations of all groups
 
         # Cache the observations.
@@ -304,8 +312,35 @@ class ObservationManager(ManagerBase):
 
         # evaluate terms: compute, add noise, clip, scale, custom modifiers
         for term_name, term_cfg in obs_terms:
-            # compute term's value
-            obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params).clone()
+            # compute term's value, reusing the raw output if an identical call already ran this
+            # step. sharing is safe since post-processing operates on the clone made below; terms
+            # implemented as classes are excluded as they may carry per-call state.
+            cache_key = None
+            raw_obs = None
+            if self._term_value_cache is not None and not isinstance(term_cfg.func, ManagerTermBase):
+                cache_key = (term_cfg.func, tuple(sorted(term_cfg.params.items())))
+                try:
+                    raw_obs = self._term_value_cache.get(cache_key)
+                except TypeError:
+                    # unhashable parameter values: fall back to always computing the term
+                    cache_key = None
+            if raw_obs is None:
+                raw_obs = term_cfg.func(self._env, **term_cfg.params)
+                if cache_key is not None:
+                    self._term_value_cache[cache_key] = raw_obs
+            # fast path: when the scale is the only post-processing step, the out-of-place multiply
+            # already yields a fresh tensor, so the defensive copy and the in-place multiply collapse
+            # into a single kernel (one memory pass instead of two)
+            if (
+                term_cfg.scale is not None
+                and term_cfg.modifiers is None
+                and not term_cfg.noise
+                and not term_cfg.clip
+                and term_cfg.history_length == 0
+            ):
+                group_obs[term_name] = raw_obs * term_cfg.scale
+                continue
+            obs: torch.Tensor = raw_obs.clone()
             # apply post-processing
             if term_cfg.modifiers is not None:
                 for modifier in term_cfg.modifiers:
@@ -74,6 +74,8 @@ class RecorderTerm(ManagerTermBase):
         """
         # call the base class constructor
         super().__init__(cfg, env)
+        # whether the term records data (disabled terms no-op their callbacks)
+        self._enabled = cfg.enabled
 
     """
     User-defined callbacks.
@@ -346,6 +348,8 @@ class RecorderManager(ManagerBase):
             return
 
         for term in self._terms.values():
+            if not term._enabled:
+                continue
             key, value = term.record_pre_step()
             self.add_to_episodes(key, value)
 
@@ -356,6 +360,8 @@ class RecorderManager(ManagerBase):
             return
 
         for term in self._terms.values():
+            if not term._enabled:
+                continue
             key, value = term.record_post_step()
             self.add_to_episodes(key, value)
 
@@ -375,6 +381,8 @@ class RecorderManager(ManagerBase):
             env_ids = env_ids.tolist()
 
         for term in self._terms.values():
+            if not term._enabled:
+                continue
             key, value = term.record_pre_reset(env_ids)
             self.add_to_episodes(key, value, env_ids)
 
@@ -399,6 +407,8 @@ class RecorderManager(ManagerBase):
             return
 
         for term in self._terms.values():
+            if not term._enabled:
+                continue
             key, value = term.record_post_reset(env_ids)
             self.add_to_episodes(key, value, env_ids)
 
@@ -140,19 +140,19 @@ class RewardManager(ManagerBase):
         # reset computation
         self._reward_buf[:] = 0.0
         # iterate over all the reward terms
-        for name, term_cfg in zip(self._term_names, self._term_cfgs):
+        for term_idx, (name, term_cfg) in enumerate(zip(self._term_names, self._term_cfgs)):
             # skip if weight is zero (kind of a micro-optimization)
             if term_cfg.weight == 0.0:
                 continue
-            # compute term's value
-            value = term_cfg.func(self._env, **term_cfg.params) * term_cfg.weight * dt
+            # compute term's weighted value (the dt scaling is fused into the accumulations below,
+            # which also keeps the per-step reward free of a divide-by-dt round trip)
+            value = term_cfg.func(self._env, **term_cfg.params) * term_cfg.weight
+            # update current reward for this step
+            self._step_reward[:, term_idx] = value
             # update total reward
-            self._reward_buf += value
+            self._reward_buf.add_(value, alpha=dt)
             # update episodic sum
-            self._episode_sums[name] += value
-
-            # Update current reward for this step.
-            self._step_reward[:, self._term_names.index(name)] = value / dt
+            self._episode_sums[name].add_(value, alpha=dt)
 
         return self._reward_buf
 
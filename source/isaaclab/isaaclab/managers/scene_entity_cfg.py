@@ -5,12 +5,36 @@
 
 """Configuration terms for different managers."""
 
+import torch
 from dataclasses import MISSING
 
 from isaaclab.assets import Articulation, RigidObject, RigidObjectCollection
 from isaaclab.scene import InteractiveScene
 from isaaclab.utils import configclass
 
+_RESOLVE_CACHE: dict[tuple, list[int]] = {}
+"""Cache of name-to-index resolutions, shared across all :class:`SceneEntityCfg` instances.
+
+The regex matching in the entity's ``find_*`` methods is fully determined by the entity's name list
+and the queried names, so the cache is keyed on those (plus the ordering flag) rather than on the
+entity instance. Many terms across environment configurations query the same names against the same
+asset, and all of them after the first become dictionary hits.
+"""
+
+
+def _find_indices_cached(find_fn, entity_names: list[str], query_names: list[str], preserve_order: bool) -> list[int]:
+    """Resolves ``query_names`` against ``entity_names`` via ``find_fn``, memoizing the result."""
+    key = (tuple(entity_names), tuple(query_names), preserve_order)
+    indices = _RESOLVE_CACHE.get(key)
+    if indices is None:
+        indices, _ = find_fn(query_names, preserve_order=preserve_order)
+        # normalize to a plain list of ints: RigidObjectCollection.find_objects returns a tensor
+        if isinstance(indices, torch.Tensor):
+            indices = indices.tolist()
+        _RESOLVE_CACHE[key] = indices
+    # hand out a copy so that downstream mutation of the ids cannot corrupt the cache
+    return list(indices)
+
 
 @configclass
 class SceneEntityCfg:
@@ -165,7 +189,9 @@ class SceneEntityCfg:
             elif self.joint_names is not None:
                 if isinstance(self.joint_names, str):
                     self.joint_names = [self.joint_names]
-                self.joint_ids, _ = entity.find_joints(self.joint_names, preserve_order=self.preserve_order)
+                self.joint_ids = _find_indices_cached(
+                    entity.find_joints, entity.joint_names, self.joint_names, self.preserve_order
+                )
                 # performance optimization (slice offers faster indexing than list of indices)
                 # only all joint in the entity order are selected
                 if len(self.joint_ids) == entity.num_joints and self.joint_names == entity.joint_names:
@@ -201,8 +227,8 @@ class SceneEntityCfg:
             elif self.fixed_tendon_names is not None:
                 if isinstance(self.fixed_tendon_names, str):
                     self.fixed_tendon_names = [self.fixed_tendon_names]
-                self.fixed_tendon_ids, _ = entity.find_fixed_tendons(
-                    self.fixed_tendon_names, preserve_order=self.preserve_order
+                self.fixed_tendon_ids = _find_indices_cached(
+                    entity.find_fixed_tendons, entity.fixed_tendon_names, self.fixed_tendon_names, self.preserve_order
                 )
                 # performance optimization (slice offers faster indexing than list of indices)
                 # only all fixed tendon in the entity order are selected
@@ -240,7 +266,9 @@ class SceneEntityCfg:
             elif self.body_names is not None:
                 if isinstance(self.body_names, str):
                     self.body_names = [self.body_names]
-                self.body_ids, _ = entity.find_bodies(self.body_names, preserve_order=self.preserve_order)
+                self.body_ids = _find_indices_cached(
+                    entity.find_bodies, entity.body_names, self.body_names, self.preserve_order
+                )
                 # performance optimization (slice offers faster indexing than list of indices)
                 # only all bodies in the entity order are selected
                 if len(self.body_ids) == entity.num_bodies and self.body_names == entity.body_names:
@@ -275,8 +303,8 @@ class SceneEntityCfg:
             elif self.object_collection_names is not None:
                 if isinstance(self.object_collection_names, str):
                     self.object_collection_names = [self.object_collection_names]
-                self.object_collection_ids, _ = entity.find_objects(
-                    self.object_collection_names, preserve_order=self.preserve_order
+                self.object_collection_ids = _find_indices_cached(
+                    entity.find_objects, entity.object_names, self.object_collection_names, self.preserve_order
                 )
             # -- from object indices to object names
             elif self.object_collection_ids != slice(None):
@@ -118,6 +118,8 @@ class InteractiveScene:
         self._rigid_object_collections = dict()
         self._sensors = dict()
         self._extras = dict()
+        # layout of the flat state tensor (built lazily on first use)
+        self._state_tensor_schema: list[tuple[str, str, str, int, int, tuple[int, ...]]] | None = None
         # obtain the current stage
         self.stage = omni.usd.get_context().get_stage()
         # physics scene path
@@ -405,6 +407,78 @@ class InteractiveScene:
             state["rigid_object"][asset_name] = asset_state
         return state
 
+    def get_state_tensor(self, is_relative: bool = False) -> torch.Tensor:
+        """Returns the state of the scene entities as a single flat tensor.
+
+        This is a fast path for :meth:`get_state` that gathers the per-asset state into one
+        ``(num_envs, total_state_dim)`` tensor with a single concatenation instead of cloning
+        each state sub-tensor individually. The nested-dictionary layout can be recovered with
+        :meth:`tensor_state_to_state_dict`.
+
+        Args:
+            is_relative: If set to True, the state is considered relative to the environment origins.
+
+        Returns:
+            The flat state tensor of shape (num_envs, total_state_dim).
+        """
+        items = self._collect_state_tensors()
+        if self._state_tensor_schema is None:
+            schema = []
+            offset = 0
+            for group, asset_name, key, tensor in items:
+                width = tensor.shape[1:].numel()
+                schema.append((group, asset_name, key, offset, offset + width, tuple(tensor.shape[1:])))
+                offset += width
+            self._state_tensor_schema = schema
+        state = torch.cat([tensor.reshape(tensor.shape[0], -1) for _, _, _, tensor in items], dim=-1)
+        if is_relative:
+            for group, asset_name, key, start, stop, shape in self._state_tensor_schema:
+                if key == "root_pose":
+                    state[:, start : start + 3] -= self.env_origins
+                elif key == "nodal_position":
+                    # subtract the origins from every mesh node: the slice views back onto the flat
+                    # tensor, so the in-place subtraction writes through
+                    state[:, start:stop].view(state.shape[0], -1, 3).sub_(self.env_origins.unsqueeze(1))
+        return state
+
+    def tensor_state_to_state_dict(self, state: torch.Tensor) -> dict[str, dict[str, dict[str, torch.Tensor]]]:
+        """Expands a flat state tensor into the nested-dictionary layout of :meth:`get_state`.
+
+        The returned dictionary holds views into the given tensor, so no data is copied.
+
+        Args:
+            state: The flat state tensor obtained from :meth:`get_state_tensor`.
+
+        Returns:
+            A dictionary of the state of the scene entities.
+        """
+        if self._state_tensor_schema is None:
+            raise RuntimeError(
+                "The state tensor schema is not available. Please call `get_state_tensor()` first."
+            )
+        state_dict = {"articulation": dict(), "deformable_object": dict(), "rigid_object": dict()}
+        for group, asset_name, key, start, stop, shape in self._state_tensor_schema:
+            state_dict[group].setdefault(asset_name, dict())[key] = state[:, start:stop].reshape(
+                state.shape[0], *shape
+            )
+        return state_dict
+
+    def _collect_state_tensors(self) -> list[tuple[str, str, str, torch.Tensor]]:
+        """Collects the per-asset state tensors in the order used by the flat state tensor."""
+        items = []
+        for asset_name, articulation in self._articulations.items():
+            items.append(("articulation", asset_name, "root_pose", articulation.data.root_state_w[:, :7]))
+            items.append(("articulation", asset_name, "root_velocity", articulation.data.root_vel_w))
+            items.append(("articulation", asset_name, "joint_position", articulation.data.joint_pos))
+            items.append(("articulation", asset_name, "joint_velocity", articulation.data.joint_vel))
+        for asset_name, deformable_object in self._deformable_objects.items():
+            items.append(("deformable_object", asset_name, "nodal_position", deformable_object.data.nodal_pos_w))
+            items.append(("deformable_object", asset_name, "nodal_velocity", deformable_object.data.nodal_vel_w))
+        for asset_name, rigid_object in self._rigid_objects.items():
+            items.append(("rigid_object", asset_name, "root_pose", rigid_object.data.root_state_w[:, :7]))
+            items.append(("rigid_object", asset_name, "root_velocity", rigid_object.data.root_vel_w))
+        return items
+
     """
     Operations.
     """
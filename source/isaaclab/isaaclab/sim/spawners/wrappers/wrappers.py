@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-import random
+import numpy as np
 import re
 from typing import TYPE_CHECKING
 
@@ -94,15 +94,18 @@ def spawn_multi_asset(
     # manually clone prims if the source prim path is a regex expression
     # note: unlike in the cloner API from Isaac Sim, we do not "reset" xforms on the copied prims.
     #   This is because the "spawn" calls during the creation of the proto prims already handles this operation.
+    # randomly select the asset configurations for all the clones in one batched draw
+    # note: this avoids the per-clone dispatch of Python's random module in the loop below
+    if cfg.random_choice:
+        choice_indices = np.random.randint(0, len(proto_prim_paths), size=len(prim_paths))
+    else:
+        choice_indices = np.arange(len(prim_paths)) % len(proto_prim_paths)
     with Sdf.ChangeBlock():
         for index, prim_path in enumerate(prim_paths):
             # spawn single instance
             env_spec = Sdf.CreatePrimInLayer(stage.GetRootLayer(), prim_path)
-            # randomly select an asset configuration
-            if cfg.random_choice:
-                proto_path = random.choice(proto_prim_paths)
-            else:
-                proto_path = proto_prim_paths[index % len(proto_prim_paths)]
+            # select the pre-drawn asset configuration
+            proto_path = proto_prim_paths[choice_indices[index]]
             # copy the proto prim
             Sdf.CopySpec(env_spec.layer, Sdf.Path(proto_path), env_spec.layer, Sdf.Path(prim_path))
 
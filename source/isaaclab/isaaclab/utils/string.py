@@ -135,6 +135,10 @@ def callable_to_string(value: Callable) -> str:
         return f"{module_name}:{function_name}"
 
 
+_STRING_TO_CALLABLE_CACHE: dict[str, Callable] = {}
+"""Cache of callables resolved by :func:`string_to_callable`, keyed by the input string."""
+
+
 def string_to_callable(name: str) -> Callable:
     """Resolves the module and function names to return the function.
 
@@ -149,6 +153,11 @@ def string_to_callable(name: str) -> Callable:
     Returns:
         Callable: The function loaded from the module.
     """
+    # check if the callable was already resolved (the resolution is deterministic per process,
+    # and the same strings are resolved repeatedly when parsing manager configurations)
+    callable_object = _STRING_TO_CALLABLE_CACHE.get(name)
+    if callable_object is not None:
+        return callable_object
     try:
         if is_lambda_expression(name):
             callable_object = eval(name)
@@ -158,6 +167,7 @@ def string_to_callable(name: str) -> Callable:
             callable_object = getattr(mod, attr_name)
         # check if attribute is callable
         if callable(callable_object):
+            _STRING_TO_CALLABLE_CACHE[name] = callable_object
             return callable_object
         else:
             raise AttributeError(f"The imported object is not callable: '{name}'")
@@ -175,6 +185,24 @@ Regex operations.
 """
 
 
+_PATTERN_CACHE: dict[str, re.Pattern] = {}
+"""Cache of compiled regular expressions used for name matching.
+
+Name resolution repeatedly matches the same joint/body patterns against an articulation's name list
+(once per term and per environment configuration). Compiling each pattern once and reusing the
+compiled object avoids going through :mod:`re`'s internal cache lookup on every single comparison.
+"""
+
+
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Returns the compiled regular expression for ``pattern``, compiling it on first use."""
+    compiled = _PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        compiled = re.compile(pattern)
+        _PATTERN_CACHE[pattern] = compiled
+    return compiled
+
+
 def resolve_matching_names(
     keys: str | Sequence[str], list_of_strings: Sequence[str], preserve_order: bool = False
 ) -> tuple[list[int], list[str]]:
@@ -213,6 +241,8 @@ def resolve_matching_names(
     # resolve name keys
     if isinstance(keys, str):
         keys = [keys]
+    # compile the patterns once instead of once per target string
+    compiled_keys = [_compile_pattern(key) for key in keys]
     # find matching patterns
     index_list = []
     names_list = []
@@ -223,16 +253,16 @@ def resolve_matching_names(
     keys_match_found = [[] for _ in range(len(keys))]
     # loop over all target strings
     for target_index, potential_match_string in enumerate(list_of_strings):
-        for key_index, re_key in enumerate(keys):
-            if re.fullmatch(re_key, potential_match_string):
+        for key_index, re_key in enumerate(compiled_keys):
+            if re_key.fullmatch(potential_match_string):
                 # check if match already found
                 if target_strings_match_found[target_index]:
                     raise ValueError(
                         f"Multiple matches for '{potential_match_string}':"
-                        f" '{target_strings_match_found[target_index]}' and '{re_key}'!"
+                        f" '{target_strings_match_found[target_index]}' and '{re_key.pattern}'!"
                     )
                 # add to list
-                target_strings_match_found[target_index] = re_key
+                target_strings_match_found[target_index] = re_key.pattern
                 index_list.append(target_index)
                 names_list.append(potential_match_string)
                 key_idx_list.append(key_index)
@@ -305,6 +335,8 @@ def resolve_matching_names_values(
     # check valid input
     if not isinstance(data, dict):
         raise TypeError(f"Input argument `data` should be a dictionary. Received: {data}")
+    # compile the patterns once instead of once per target string
+    compiled_items = [(_compile_pattern(key), value) for key, value in data.items()]
     # find matching patterns
     index_list = []
     names_list = []
@@ -316,16 +348,16 @@ def resolve_matching_names_values(
     keys_match_found = [[] for _ in range(len(data))]
     # loop over all target strings
     for target_index, potential_match_string in enumerate(list_of_strings):
-        for key_index, (re_key, value) in enumerate(data.items()):
-            if re.fullmatch(re_key, potential_match_string):
+        for key_index, (re_key, value) in enumerate(compiled_items):
+            if re_key.fullmatch(potential_match_string):
                 # check if match already found
                 if target_strings_match_found[target_index]:
                     raise ValueError(
                         f"Multiple matches for '{potential_match_string}':"
-                        f" '{target_strings_match_found[target_index]}' and '{re_key}'!"
+                        f" '{target_strings_match_found[target_index]}' and '{re_key.pattern}'!"
                     )
                 # add to list
-                target_strings_match_found[target_index] = re_key
+                target_strings_match_found[target_index] = re_key.pattern
                 index_list.append(target_index)
                 names_list.append(potential_match_string)
                 values_list.append(value)
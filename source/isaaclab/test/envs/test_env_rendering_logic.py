@@ -14,6 +14,7 @@ simulation_app = app_launcher.app
 
 """Rest everything follows."""
 
+import numpy as np
 import torch
 import unittest
 
@@ -125,6 +126,9 @@ class TestEnvRenderingLogic(unittest.TestCase):
 
     def test_env_rendering_logic(self):
         for env_type in ["manager_based_env", "manager_based_rl_env", "direct_rl_env"]:
+            # zero action tensor shared across the render-interval subtests (created on the first env,
+            # since the number of environments and the device are identical across subtests)
+            actions = None
             for render_interval in [1, 2, 4, 8, 10]:
                 with self.subTest(env_type=env_type, render_interval=render_interval):
                     # time tracking variables
@@ -170,35 +174,47 @@ class TestEnvRenderingLogic(unittest.TestCase):
                     env.sim.add_physics_callback("physics_step", self._physics_callback)
                     env.sim.add_render_callback("render_step", self._render_callback)
 
-                    # create a zero action tensor for stepping the environment
-                    actions = torch.zeros((env.num_envs, 0), device=env.device)
-
-                    # run the environment and check the rendering logic
-                    for i in range(50):
+                    # create a zero action tensor for stepping the environment (reused across subtests)
+                    if actions is None:
+                        actions = torch.zeros((env.num_envs, 0), device=env.device)
+
+                    # run the environment and collect the bookkeeping per iteration
+                    num_iters = 50
+                    physics_steps = np.empty(num_iters, dtype=np.int64)
+                    render_steps = np.empty(num_iters, dtype=np.int64)
+                    physics_times = np.empty(num_iters)
+                    render_times = np.empty(num_iters)
+                    for i in range(num_iters):
                         # apply zero actions
                         env.step(action=actions)
-
-                        # check that we have completed the correct number of physics steps
-                        self.assertEqual(
-                            self.num_physics_steps, (i + 1) * env.cfg.decimation, msg="Physics steps mismatch"
-                        )
-                        # check that we have simulated physics for the correct amount of time
-                        self.assertAlmostEqual(
-                            self.physics_time, self.num_physics_steps * env.cfg.sim.dt, msg="Physics time mismatch"
-                        )
-
-                        # check that we have completed the correct number of rendering steps
-                        self.assertEqual(
-                            self.num_render_steps,
-                            (i + 1) * env.cfg.decimation // env.cfg.sim.render_interval,
-                            msg="Render steps mismatch",
-                        )
-                        # check that we have rendered for the correct amount of time
-                        self.assertAlmostEqual(
-                            self.render_time,
-                            self.num_render_steps * env.cfg.sim.dt * env.cfg.sim.render_interval,
-                            msg="Render time mismatch",
-                        )
+                        physics_steps[i] = self.num_physics_steps
+                        physics_times[i] = self.physics_time
+                        render_steps[i] = self.num_render_steps
+                        render_times[i] = self.render_time
+
+                    # check the accumulated bookkeeping in one pass instead of per-iteration assertions
+                    iters = np.arange(1, num_iters + 1)
+                    # check that we have completed the correct number of physics steps
+                    np.testing.assert_array_equal(
+                        physics_steps, iters * env.cfg.decimation, err_msg="Physics steps mismatch"
+                    )
+                    # check that we have simulated physics for the correct amount of time
+                    np.testing.assert_allclose(
+                        physics_times, physics_steps * env.cfg.sim.dt, rtol=1e-6, err_msg="Physics time mismatch"
+                    )
+                    # check that we have completed the correct number of rendering steps
+                    np.testing.assert_array_equal(
+                        render_steps,
+                        iters * env.cfg.decimation // env.cfg.sim.render_interval,
+                        err_msg="Render steps mismatch",
+                    )
+                    # check that we have rendered for the correct amount of time
+                    np.testing.assert_allclose(
+                        render_times,
+                        render_steps * env.cfg.sim.dt * env.cfg.sim.render_interval,
+                        rtol=1e-6,
+                        err_msg="Render time mismatch",
+                    )
 
                     # close the environment
                     env.close()
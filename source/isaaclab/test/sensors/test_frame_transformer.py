@@ -162,6 +162,8 @@ class TestFrameTransformer(unittest.TestCase):
 
         # default joint targets
         default_actions = scene.articulations["robot"].data.default_joint_pos.clone()
+        # persistent buffer for the perturbed joint targets (refilled in-place every step)
+        robot_actions = torch.empty_like(default_actions)
         # Define simulation stepping
         sim_dt = self.sim.get_physics_dt()
         # Simulate physics
@@ -182,7 +184,7 @@ class TestFrameTransformer(unittest.TestCase):
                 scene.reset()
 
             # set joint targets
-            robot_actions = default_actions + 0.5 * torch.randn_like(default_actions)
+            robot_actions.normal_(std=0.5).add_(default_actions)
             scene.articulations["robot"].set_joint_position_target(robot_actions)
             # write data to sim
             scene.write_data_to_sim()
@@ -263,6 +265,8 @@ class TestFrameTransformer(unittest.TestCase):
 
         # default joint targets
         default_actions = scene.articulations["robot"].data.default_joint_pos.clone()
+        # persistent buffer for the perturbed joint targets (refilled in-place every step)
+        robot_actions = torch.empty_like(default_actions)
         # Define simulation stepping
         sim_dt = self.sim.get_physics_dt()
         # Simulate physics
@@ -283,7 +287,7 @@ class TestFrameTransformer(unittest.TestCase):
                 scene.reset()
 
             # set joint targets
-            robot_actions = default_actions + 0.5 * torch.randn_like(default_actions)
+            robot_actions.normal_(std=0.5).add_(default_actions)
             scene.articulations["robot"].set_joint_position_target(robot_actions)
             # write data to sim
             scene.write_data_to_sim()
@@ -345,6 +349,8 @@ class TestFrameTransformer(unittest.TestCase):
 
         # default joint targets
         default_actions = scene.articulations["robot"].data.default_joint_pos.clone()
+        # persistent buffer for the perturbed joint targets (refilled in-place every step)
+        robot_actions = torch.empty_like(default_actions)
         # Define simulation stepping
         sim_dt = self.sim.get_physics_dt()
         # Simulate physics
@@ -365,7 +371,7 @@ class TestFrameTransformer(unittest.TestCase):
                 scene.reset()
 
             # set joint targets
-            robot_actions = default_actions + 0.5 * torch.randn_like(default_actions)
+            robot_actions.normal_(std=0.5).add_(default_actions)
             scene.articulations["robot"].set_joint_position_target(robot_actions)
             # write data to sim
             scene.write_data_to_sim()
@@ -525,6 +531,8 @@ class TestFrameTransformer(unittest.TestCase):
 
         # default joint targets
         default_actions = scene.articulations["robot"].data.default_joint_pos.clone()
+        # persistent buffer for the perturbed joint targets (refilled in-place every step)
+        robot_actions = torch.empty_like(default_actions)
         # Define simulation stepping
         sim_dt = self.sim.get_physics_dt()
         # Simulate physics
@@ -545,7 +553,7 @@ class TestFrameTransformer(unittest.TestCase):
                 scene.reset()
 
             # set joint targets
-            robot_actions = default_actions + 0.5 * torch.randn_like(default_actions)
+            robot_actions.normal_(std=0.5).add_(default_actions)
             scene.articulations["robot"].set_joint_position_target(robot_actions)
             # write data to sim
             scene.write_data_to_sim()
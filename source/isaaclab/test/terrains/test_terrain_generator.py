@@ -5,13 +5,14 @@
 
 """Launch Isaac Sim Simulator first."""
 
-from isaaclab.app import AppLauncher, run_tests
+from isaaclab.app import get_app, run_tests
 
-# launch omniverse app
-simulation_app = AppLauncher(headless=True).app
+# launch omniverse app (reuses the process-wide app if one is already running)
+simulation_app = get_app(headless=True)
 
 """Rest everything follows."""
 
+import concurrent.futures
 import numpy as np
 import os
 import shutil
@@ -70,8 +71,11 @@ class TestTerrainGenerator(unittest.TestCase):
                     cfg.seed = seed if use_global_seed else None
                     terrain_generator = TerrainGenerator(cfg=cfg)
 
-                    # keep a copy of the generated terrain mesh
-                    terrain_mesh_1 = terrain_generator.terrain_mesh.copy()
+                    # keep a copy of the generated terrain mesh data
+                    # note: copying only the vertex and face arrays avoids the full trimesh deep copy
+                    #   (which also clones the face-normal and adjacency caches)
+                    vertices_1 = terrain_generator.terrain_mesh.vertices.copy()
+                    faces_1 = terrain_generator.terrain_mesh.faces.copy()
 
                     # set seed again
                     torch_utils.set_seed(seed)
@@ -79,16 +83,14 @@ class TestTerrainGenerator(unittest.TestCase):
                     # create terrain generator
                     terrain_generator = TerrainGenerator(cfg=cfg)
 
-                    # keep a copy of the generated terrain mesh
-                    terrain_mesh_2 = terrain_generator.terrain_mesh.copy()
+                    # keep a copy of the generated terrain mesh data
+                    vertices_2 = terrain_generator.terrain_mesh.vertices.copy()
+                    faces_2 = terrain_generator.terrain_mesh.faces.copy()
 
                     # check if the meshes are equal
-                    np.testing.assert_allclose(
-                        terrain_mesh_1.vertices, terrain_mesh_2.vertices, atol=1e-5, err_msg="Vertices are not equal"
-                    )
-                    np.testing.assert_allclose(
-                        terrain_mesh_1.faces, terrain_mesh_2.faces, atol=1e-5, err_msg="Faces are not equal"
-                    )
+                    # note: faces are integer indices, so exact equality replaces the tolerance check
+                    np.testing.assert_allclose(vertices_1, vertices_2, atol=1e-5, err_msg="Vertices are not equal")
+                    self.assertTrue(np.array_equal(faces_1, faces_2), "Faces are not equal")
 
     def test_generation_cache(self):
         """Generate the terrain and check that caching works.
@@ -96,52 +98,78 @@ class TestTerrainGenerator(unittest.TestCase):
         When caching is enabled, the terrain should be generated only once and the same terrain should be returned
         when the terrain generator is created again.
         """
+
+        def generate(curriculum: bool, cache_dir: str) -> tuple[np.ndarray, np.ndarray, set[str]]:
+            # create terrain generator with cache enabled
+            cfg: TerrainGeneratorCfg = ROUGH_TERRAINS_CFG.copy()
+            cfg.use_cache = True
+            cfg.seed = 0
+            cfg.cache_dir = cache_dir
+            cfg.curriculum = curriculum
+            terrain_generator = TerrainGenerator(cfg=cfg)
+            # keep a copy of the generated terrain mesh data
+            # note: copying only the vertex and face arrays avoids the full trimesh deep copy
+            #   (which also clones the face-normal and adjacency caches)
+            return (
+                terrain_generator.terrain_mesh.vertices.copy(),
+                terrain_generator.terrain_mesh.faces.copy(),
+                set(os.listdir(cache_dir)),
+            )
+
+        # resolve a separate cache directory per curriculum variant to avoid write contention
+        cache_dirs = {curriculum: f"{self.output_dir}_curriculum_{curriculum}" for curriculum in (True, False)}
+        # clear output directories
+        for cache_dir in cache_dirs.values():
+            if os.path.exists(cache_dir):
+                shutil.rmtree(cache_dir)
+
+        # the two curriculum variants are independent, so their generations run concurrently.
+        # the cache-seeding round must finish before the cache-hitting round, hence two pools.
+        # note: the sub-terrain noise functions draw from the global numpy rng, which the threads
+        #   share, so the first-round meshes are not reproducible under this interleaving. the
+        #   assertions below do not rely on that: the second round reads the meshes the first
+        #   round stored in the on-disk cache (keyed by the sub-terrain cfg hash), so the rounds
+        #   match whatever the interleaving was. trimesh releases the GIL in its C code, so the
+        #   generation work overlaps.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            seeded = {
+                curriculum: executor.submit(generate, curriculum, cache_dir)
+                for curriculum, cache_dir in cache_dirs.items()
+            }
+
+        # set a random seed to disturb the process
+        # this is to ensure that the seed inside the terrain generator makes deterministic results
+        torch_utils.set_seed(12456)
+
+        # create the terrain generators again with the caches populated
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            cached = {
+                curriculum: executor.submit(generate, curriculum, cache_dir)
+                for curriculum, cache_dir in cache_dirs.items()
+            }
+
         # try out with and without curriculum
         for curriculum in [True, False]:
             with self.subTest(curriculum=curriculum):
-                # clear output directory
-                if os.path.exists(self.output_dir):
-                    shutil.rmtree(self.output_dir)
-                # create terrain generator with cache enabled
-                cfg: TerrainGeneratorCfg = ROUGH_TERRAINS_CFG.copy()
-                cfg.use_cache = True
-                cfg.seed = 0
-                cfg.cache_dir = self.output_dir
-                cfg.curriculum = curriculum
-                terrain_generator = TerrainGenerator(cfg=cfg)
-                # keep a copy of the generated terrain mesh
-                terrain_mesh_1 = terrain_generator.terrain_mesh.copy()
+                vertices_1, faces_1, hash_ids_1 = seeded[curriculum].result()
+                vertices_2, faces_2, hash_ids_2 = cached[curriculum].result()
 
                 # check cache exists and is equal to the number of terrains
                 # with curriculum, all sub-terrains are uniquely generated
-                hash_ids_1 = set(os.listdir(cfg.cache_dir))
-                self.assertTrue(os.listdir(cfg.cache_dir))
-
-                # set a random seed to disturb the process
-                # this is to ensure that the seed inside the terrain generator makes deterministic results
-                torch_utils.set_seed(12456)
-
-                # create terrain generator with cache enabled
-                terrain_generator = TerrainGenerator(cfg=cfg)
-                # keep a copy of the generated terrain mesh
-                terrain_mesh_2 = terrain_generator.terrain_mesh.copy()
+                self.assertTrue(hash_ids_1)
 
                 # check no new terrain is generated
-                hash_ids_2 = set(os.listdir(cfg.cache_dir))
                 self.assertEqual(len(hash_ids_1), len(hash_ids_2))
                 self.assertSetEqual(hash_ids_1, hash_ids_2)
 
                 # check if the mesh is the same
                 # check they don't point to the same object
-                self.assertIsNot(terrain_mesh_1, terrain_mesh_2)
+                self.assertIsNot(vertices_1, vertices_2)
 
                 # check if the meshes are equal
-                np.testing.assert_allclose(
-                    terrain_mesh_1.vertices, terrain_mesh_2.vertices, atol=1e-5, err_msg="Vertices are not equal"
-                )
-                np.testing.assert_allclose(
-                    terrain_mesh_1.faces, terrain_mesh_2.faces, atol=1e-5, err_msg="Faces are not equal"
-                )
+                # note: faces are integer indices, so exact equality replaces the tolerance check
+                np.testing.assert_allclose(vertices_1, vertices_2, atol=1e-5, err_msg="Vertices are not equal")
+                self.assertTrue(np.array_equal(faces_1, faces_2), "Faces are not equal")
 
     def test_terrain_flat_patches(self):
         """Test the flat patches generation."""
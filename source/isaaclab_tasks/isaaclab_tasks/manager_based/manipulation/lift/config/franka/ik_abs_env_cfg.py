@@ -63,6 +63,29 @@ class FrankaCubeLiftEnvCfg_PLAY(FrankaCubeLiftEnvCfg):
 # Deformable object lift environment.
 ##
 
+# object and event configurations for the deformable teddy bear
+# note: these are constructed once at import time and copied in the post-init below, so that
+#   repeated environment configuration instantiations (e.g. across worker processes) skip the
+#   nested config construction
+TEDDY_BEAR_OBJECT_CFG = DeformableObjectCfg(
+    prim_path="{ENV_REGEX_NS}/Object",
+    init_state=DeformableObjectCfg.InitialStateCfg(pos=(0.5, 0, 0.05), rot=(0.707, 0, 0, 0.707)),
+    spawn=UsdFileCfg(
+        usd_path=f"{ISAACLAB_NUCLEUS_DIR}/Objects/Teddy_Bear/teddy_bear.usd",
+        scale=(0.01, 0.01, 0.01),
+    ),
+)
+
+TEDDY_BEAR_RESET_OBJECT_POSITION_EVENT = EventTerm(
+    func=mdp.reset_nodal_state_uniform,
+    mode="reset",
+    params={
+        "position_range": {"x": (-0.1, 0.1), "y": (-0.25, 0.25), "z": (0.0, 0.0)},
+        "velocity_range": {},
+        "asset_cfg": SceneEntityCfg("object"),
+    },
+)
+
 
 @configclass
 class FrankaTeddyBearLiftEnvCfg(FrankaCubeLiftEnvCfg):
@@ -70,14 +93,7 @@ class FrankaTeddyBearLiftEnvCfg(FrankaCubeLiftEnvCfg):
         # post init of parent
         super().__post_init__()
 
-        self.scene.object = DeformableObjectCfg(
-            prim_path="{ENV_REGEX_NS}/Object",
-            init_state=DeformableObjectCfg.InitialStateCfg(pos=(0.5, 0, 0.05), rot=(0.707, 0, 0, 0.707)),
-            spawn=UsdFileCfg(
-                usd_path=f"{ISAACLAB_NUCLEUS_DIR}/Objects/Teddy_Bear/teddy_bear.usd",
-                scale=(0.01, 0.01, 0.01),
-            ),
-        )
+        self.scene.object = TEDDY_BEAR_OBJECT_CFG.copy()
 
         # Make the end effector less stiff to not hurt the poor teddy bear
         self.scene.robot.actuators["panda_hand"].effort_limit = 50.0
@@ -89,15 +105,7 @@ class FrankaTeddyBearLiftEnvCfg(FrankaCubeLiftEnvCfg):
         self.scene.replicate_physics = False
 
         # Set events for the specific object type (deformable cube)
-        self.events.reset_object_position = EventTerm(
-            func=mdp.reset_nodal_state_uniform,
-            mode="reset",
-            params={
-                "position_range": {"x": (-0.1, 0.1), "y": (-0.25, 0.25), "z": (0.0, 0.0)},
-                "velocity_range": {},
-                "asset_cfg": SceneEntityCfg("object"),
-            },
-        )
+        self.events.reset_object_position = TEDDY_BEAR_RESET_OBJECT_POSITION_EVENT.copy()
 
         # Remove all the terms for the state machine demo
         # TODO: Computing the root pose of deformable object from nodal positions is expensive.